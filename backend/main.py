@@ -1,11 +1,15 @@
-from fastapi import FastAPI, HTTPException
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
-from typing import Literal, Union, Optional
+from fastapi import FastAPI, HTTPException, Query, Response
+from fastapi.responses import ORJSONResponse
+from pydantic import AfterValidator, BaseModel, Field
+from typing import Annotated, List, Literal, Union, Optional
 from dotenv import load_dotenv
 import os
-import json
-from groq import Groq
+import asyncio
+import orjson
+import hashlib
+import httpx
+from cachetools import LRUCache
+from groq import AsyncGroq, NotFoundError
 from datetime import datetime
 import re
 import uvicorn
@@ -15,28 +19,137 @@ load_dotenv()
 app = FastAPI(
     title="Intelligent Incident Parser API",
     description="Convert unstructured incident reports to structured JSON using Groq API",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://127.0.0.1:3000"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+_CORS_ORIGINS = frozenset({b"http://localhost:3000", b"http://127.0.0.1:3000"})
+_CORS_ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
+class CORSOriginMiddleware:
+    """
+    Pure ASGI CORS handling for the fixed set of frontend origins.
+
+    Equivalent to CORSMiddleware with allow_credentials and wildcard methods
+    and headers, but the origin check is a single frozenset lookup on the
+    raw header bytes.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        is_preflight = False
+        request_headers = None
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                is_preflight = True
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin not in _CORS_ORIGINS:
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = [
+            (b"access-control-allow-origin", origin),
+            (b"access-control-allow-credentials", b"true"),
+            (b"vary", b"Origin"),
+        ]
+
+        if scope["method"] == "OPTIONS" and is_preflight:
+            headers = cors_headers + [
+                (b"access-control-allow-methods", _CORS_ALLOW_METHODS),
+                (b"access-control-max-age", b"600"),
+                (b"content-type", b"text/plain; charset=utf-8"),
+                (b"content-length", b"2"),
+            ]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 200, "headers": headers})
+            await send({"type": "http.response.body", "body": b"OK"})
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+
+app.add_middleware(CORSOriginMiddleware)
 
 groq_api_key = os.getenv("GROQ_API_KEY")
 if not groq_api_key:
     raise ValueError(
         "GROQ_API_KEY environment variable is not set. Please create a .env file with your Groq API key.")
 
-groq_client = Groq(api_key=groq_api_key)
+# One pooled HTTP/2 client for all Groq calls, so connections and TLS sessions
+# are reused across requests instead of being re-established.
+_http_client = httpx.AsyncClient(
+    http2=True,
+    limits=httpx.Limits(max_keepalive_connections=100, max_connections=200),
+    timeout=30.0
+)
+groq_client = AsyncGroq(api_key=groq_api_key, http_client=_http_client)
+
+# Parsed results keyed by SHA-256 of the normalized incident text, so repeat
+# submissions of the same report skip the Groq round-trip entirely.
+_RESULT_CACHE = LRUCache(maxsize=4096)
+
+# Groq calls currently running, keyed like _RESULT_CACHE.
+_IN_FLIGHT = {}
+
+# Caps the Groq calls the batch endpoint and batch fallback have in flight
+# across this whole process, to stay within Groq's rate limits.
+_BATCH_CONCURRENCY = 16
+_BATCH_SEMAPHORE = asyncio.Semaphore(_BATCH_CONCURRENCY)
+
+# Groq batch job states after which no further progress is made, and how
+# often to re-check a job while a caller is waiting on it.
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+_BATCH_POLL_INTERVAL = 5.0
+
+# Largest batch job whose unfinished reports may be re-run interactively
+# within a single GET /api/batch/{job_id} request.
+_BATCH_FALLBACK_MAX = 100
+
+# States in which a batch job is already stopping and must not be cancelled.
+_BATCH_WINDING_DOWN_STATUSES = frozenset({"cancelling", "finalizing"})
+
+# Metadata tag on batch jobs created by this service; other jobs in the Groq
+# account are not exposed through the batch endpoints.
+_BATCH_SOURCE = "incident-parser"
+
+# Limits that keep a batch input file within Groq's 100 MB file size limit.
+_BATCH_TEXT_MAX_LENGTH = 4000
+_BATCH_FILE_MAX_BYTES = 100 * 1024 * 1024
+
+
+def _check_incident_text(value: str) -> str:
+    if len(value.strip()) < 10:
+        raise ValueError("Incident text must be at least 10 characters long")
+    return value
+
+
+# Report text accepted by every parse endpoint: at least 10 characters once
+# surrounding whitespace is ignored.
+IncidentText = Annotated[str, Field(min_length=10),
+                         AfterValidator(_check_incident_text)]
 
 
 class IncidentInput(BaseModel):
-    text: str = Field(...,
-                      description="Unstructured incident report text", min_length=10)
+    text: IncidentText = Field(...,
+                               description="Unstructured incident report text")
 
 
 class ParsedIncident(BaseModel):
@@ -47,58 +160,151 @@ class ParsedIncident(BaseModel):
     Impact_Count: int
 
 
+# Bound once so each request calls straight into pydantic-core.
+_PARSED_VALIDATOR = ParsedIncident.__pydantic_validator__
+
+
 class ParseResponse(BaseModel):
     success: bool
     data: Optional[ParsedIncident] = None
     error: Optional[str] = None
 
 
-def extract_timestamp(text: str) -> str:
-    """Extract time from text in HH:MM:SS format"""
-    now = datetime.now()
-    default_time = now.strftime("%H:%M:%S")
-
-    pm_pattern = r'(\d{1,2}):(\d{2})\s*(PM|pm)'
-    am_pattern = r'(\d{1,2}):(\d{2})\s*(AM|am)'
-    time_pattern = r'(\d{1,2}):(\d{2})'
-
-    pm_match = re.search(pm_pattern, text, re.IGNORECASE)
-    if pm_match:
-        hour = int(pm_match.group(1))
-        minute = pm_match.group(2)
-        if hour != 12:
-            hour = (hour + 12) % 24
-        return f"{hour:02d}:{minute}:00"
-
-    am_match = re.search(am_pattern, text, re.IGNORECASE)
-    if am_match:
-        hour = int(am_match.group(1))
-        minute = am_match.group(2)
-        if hour == 12:
+class IncidentBatch(BaseModel):
+    texts: List[IncidentText] = Field(
+        ..., description="Unstructured incident report texts", min_length=1, max_length=100)
+
+
+class BatchParseResponse(BaseModel):
+    results: List[ParseResponse]
+
+
+class IncidentBatchJob(BaseModel):
+    texts: List[Annotated[IncidentText, Field(max_length=_BATCH_TEXT_MAX_LENGTH)]] = Field(
+        ..., description="Unstructured incident report texts", min_length=1, max_length=50000)
+
+
+class BatchJobResponse(BaseModel):
+    job_id: str
+    status: str
+    results: Optional[List[ParseResponse]] = None
+
+
+_TIME_ALL = re.compile(
+    r'(?P<h>\d{1,2}):(?P<m>\d{2})(?:\s*(?P<ampm>[AaPp][Mm]))?')
+_HMS_RE = re.compile(r'^\d{2}:\d{2}:\d{2}$')
+_ISO_RE = re.compile(r'\d{4}-\d{2}-\d{2}T(\d{2}:\d{2}:\d{2})')
+_INT_RE = re.compile(r'\d+')
+_FENCE_RE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$', re.IGNORECASE)
+
+# Keyword tables for _try_fast_parse, which handles short reports whose
+# fields can be read off directly without asking the LLM.
+_SEVERITY_KEYWORDS = {
+    "critical": "High", "outage": "High", "down": "High", "crashed": "High",
+    "degraded": "Med", "slow": "Med", "intermittent": "Med", "partial": "Med",
+    "minor": "Low", "cosmetic": "Low", "typo": "Low",
+}
+_SEVERITY_RE = re.compile(
+    r'\b(' + '|'.join(_SEVERITY_KEYWORDS) + r')\b', re.IGNORECASE)
+
+_COMPONENT_NAMES = {
+    "database": "Database", "load balancer": "Load Balancer", "api": "API",
+    "cache": "Cache", "queue": "Queue",
+}
+_COMPONENT_RE = re.compile(
+    r'\b(?P<kind>database|load balancer|api|cache|queue)\b'
+    r'(?:\s+(?P<name>[A-Za-z0-9]+(?:-[A-Za-z0-9]+)*-\d+))?', re.IGNORECASE)
+
+# The lookbehind rejects counts that are the tail of a larger number such
+# as "1,500", which are left to the LLM rather than misread as 500.
+_IMPACT_RE = re.compile(r'(?<![\d,.])(\d+)\s+users?\b', re.IGNORECASE)
+
+_CAUSES = (
+    (re.compile(r'\bmigration', re.IGNORECASE), "Migration script"),
+    (re.compile(r'\bdeploy', re.IGNORECASE), "Deployment"),
+    (re.compile(r'\bconfig', re.IGNORECASE), "Configuration change"),
+    (re.compile(r'\b(?:out of memory|oom|memory leak)\b', re.IGNORECASE),
+     "Memory exhaustion"),
+    (re.compile(r'\bdisk (?:full|space)', re.IGNORECASE), "Disk full"),
+    (re.compile(r'\b(?:certificate|cert) expir', re.IGNORECASE),
+     "Expired certificate"),
+    (re.compile(r'\bnetwork', re.IGNORECASE), "Network issue"),
+)
+
+
+def _format_time_match(time_match: re.Match) -> str:
+    """Convert a _TIME_ALL match to HH:MM:SS, applying any AM/PM suffix"""
+    hour = int(time_match.group("h"))
+    minute = time_match.group("m")
+    ampm = time_match.group("ampm")
+    if ampm is not None:
+        if ampm.lower() == "pm":
+            if hour != 12:
+                hour = (hour + 12) % 24
+        elif hour == 12:
             hour = 0
-        return f"{hour:02d}:{minute}:00"
+    return f"{hour:02d}:{minute}:00"
+
 
-    time_match = re.search(time_pattern, text)
+def extract_timestamp(text: str) -> str:
+    """Extract time from text in HH:MM:SS format"""
+    time_match = _TIME_ALL.search(text)
     if time_match:
-        hour = int(time_match.group(1))
-        minute = time_match.group(2)
-        return f"{hour:02d}:{minute}:00"
+        return _format_time_match(time_match)
 
-    return default_time
+    return datetime.now().strftime("%H:%M:%S")
 
 
-def create_parsing_prompt(incident_text: str) -> tuple:
+def _try_fast_parse(text: str) -> Optional[dict]:
     """
-    Create a well-engineered prompt for Groq API to prevent hallucinations.
+    Extract all fields with regexes alone, without calling Groq.
 
-    Strategy:
-    1. Clear system instructions with examples
-    2. Explicit JSON schema requirements
-    3. Validation rules to prevent made-up data
-    4. Few-shot learning with example
+    Returns None unless every field is found in the text, in which case the
+    caller can skip the LLM for this report.
     """
+    severities = {_SEVERITY_KEYWORDS[word.lower()]
+                  for word in _SEVERITY_RE.findall(text)}
+    if len(severities) != 1:
+        return None
+    severity = severities.pop()
+
+    # Without an identifier such as "US-East-1" the exact component name
+    # ("Login API", "Payment API") is left to the LLM.
+    component_match = _COMPONENT_RE.search(text)
+    if not component_match or not component_match.group("name"):
+        return None
+    component = (f"{_COMPONENT_NAMES[component_match.group('kind').lower()]} "
+                 f"{component_match.group('name')}")
+
+    time_match = _TIME_ALL.search(text)
+    if not time_match:
+        return None
+
+    impact_match = _IMPACT_RE.search(text)
+    if not impact_match:
+        return None
+
+    for cause_re, cause in _CAUSES:
+        if cause_re.search(text):
+            break
+    else:
+        return None
+
+    return {
+        "Severity": severity,
+        "Component": component,
+        "Timestamp": _format_time_match(time_match),
+        "Suspected_Cause": cause,
+        "Impact_Count": int(impact_match.group(1))
+    }
 
-    system_prompt = """You are an expert incident parser. Your job is to extract structured information from unstructured incident reports.
+
+# Prompt engineered to prevent hallucinations:
+# 1. Clear system instructions with examples
+# 2. Explicit JSON schema requirements
+# 3. Validation rules to prevent made-up data
+# 4. Few-shot learning with example
+_SYSTEM_PROMPT = """You are an expert incident parser. Your job is to extract structured information from unstructured incident reports.
 
 CRITICAL RULES - Follow these exactly:
 1. Extract ONLY information that is explicitly mentioned or can be reasonably inferred from the text
@@ -144,86 +350,190 @@ Output:
 
 Remember: Only extract what's in the text. Don't make up details."""
 
-    user_prompt = f"""Parse this incident report and extract structured data. Return ONLY the JSON object with no additional text:
+_SYS_MSG = {"role": "system", "content": _SYSTEM_PROMPT}
+_USER_PREFIX = "Parse this incident report and extract structured data. Return ONLY the JSON object with no additional text:\n\n"
+
 
-{incident_text}"""
+_SEVERITY_MAP = {
+    "high": "High", "critical": "High",
+    "med": "Med", "medium": "Med",
+    "low": "Low",
+}
 
-    return system_prompt, user_prompt
+
+def _normalize_severity(value) -> str:
+    severity_lower = str(value).lower()
+    severity = _SEVERITY_MAP.get(severity_lower)
+    if severity is not None:
+        return severity
+    if "high" in severity_lower or "critical" in severity_lower:
+        return "High"
+    if "med" in severity_lower:
+        return "Med"
+    return "Low"
+
+
+def _normalize_impact_count(value) -> int:
+    if not isinstance(value, str):
+        return int(value)
+    number_match = _INT_RE.search(value)
+    return int(number_match.group()) if number_match else 0
+
+
+def _normalize_timestamp(value) -> str:
+    if _HMS_RE.match(value):
+        return value
+    iso_match = _ISO_RE.match(value)
+    if iso_match:
+        return iso_match.group(1)
+    return extract_timestamp(value)
+
+
+# Field name -> function that coerces the model's value into the shape
+# ParsedIncident expects, falling back to a default where it can.
+_FIELD_NORMALIZERS = {
+    "Severity": _normalize_severity,
+    "Component": lambda value: value if value and value.strip() else "Unknown Component",
+    "Timestamp": _normalize_timestamp,
+    "Suspected_Cause": lambda value: value if value and value.strip() else "Unknown",
+    "Impact_Count": _normalize_impact_count,
+}
 
 
 def parse_groq_response(response_text: str) -> dict:
     """Parse and validate Groq API response, handling edge cases"""
     try:
-        response_text = response_text.strip()
-        if response_text.startswith("```json"):
-            response_text = response_text[7:]
-        if response_text.startswith("```"):
-            response_text = response_text[3:]
-        if response_text.endswith("```"):
-            response_text = response_text[:-3]
-        response_text = response_text.strip()
-
-        data = json.loads(response_text)
-
-        required_fields = ["Severity", "Component",
-                           "Timestamp", "Suspected_Cause", "Impact_Count"]
-        for field in required_fields:
+        response_text = _FENCE_RE.sub('', response_text).strip()
+
+        data = orjson.loads(response_text)
+
+        incident = {}
+        for field, normalize in _FIELD_NORMALIZERS.items():
             if field not in data:
                 raise ValueError(f"Missing required field: {field}")
+            incident[field] = normalize(data[field])
+
+        return incident
 
-        if data["Severity"] not in ["High", "Med", "Low"]:
-            severity_lower = str(data["Severity"]).lower()
-            if "high" in severity_lower or "critical" in severity_lower:
-                data["Severity"] = "High"
-            elif "med" in severity_lower or "medium" in severity_lower:
-                data["Severity"] = "Med"
-            else:
-                data["Severity"] = "Low"
-
-        if isinstance(data["Impact_Count"], str):
-            numbers = re.findall(r'\d+', str(data["Impact_Count"]))
-            data["Impact_Count"] = int(numbers[0]) if numbers else 0
-        else:
-            data["Impact_Count"] = int(data["Impact_Count"])
-
-        timestamp = data["Timestamp"]
-        if not re.match(r'^\d{2}:\d{2}:\d{2}$', timestamp):
-            iso_match = re.match(
-                r'\d{4}-\d{2}-\d{2}T(\d{2}:\d{2}:\d{2})', timestamp)
-            if iso_match:
-                data["Timestamp"] = iso_match.group(1)
-            else:
-                data["Timestamp"] = extract_timestamp(
-                    data.get("Timestamp", ""))
-
-        if not data["Component"] or len(data["Component"].strip()) == 0:
-            data["Component"] = "Unknown Component"
-
-        if not data["Suspected_Cause"] or len(data["Suspected_Cause"].strip()) == 0:
-            data["Suspected_Cause"] = "Unknown"
-
-        return data
-
-    except json.JSONDecodeError as e:
+    except orjson.JSONDecodeError as e:
         raise ValueError(f"Invalid JSON response from AI: {str(e)}")
     except Exception as e:
         raise ValueError(f"Error parsing AI response: {str(e)}")
 
 
+@app.on_event("shutdown")
+async def close_http_client():
+    await _http_client.aclose()
+
+
+# Liveness bodies never change after startup, so serialize them once.
+_ROOT_BYTES = orjson.dumps({
+    "message": "Intelligent Incident Parser API",
+    "status": "running",
+    "version": "1.0.0"
+})
+_HEALTH_BYTES = orjson.dumps(
+    {"status": "healthy", "groq_configured": groq_api_key is not None})
+
+
 @app.get("/")
 async def root():
-    return {
-        "message": "Intelligent Incident Parser API",
-        "status": "running",
-        "version": "1.0.0"
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 
 @app.get("/health")
 async def health():
-    return {"status": "healthy", "groq_configured": groq_api_key is not None}
+    return Response(_HEALTH_BYTES, media_type="application/json")
+
+
+def _completion_params(text: str) -> dict:
+    """Build the Groq chat-completion arguments for one incident report"""
+    return {
+        "model": "llama-3.1-8b-instant",
+        "messages": [
+            _SYS_MSG,
+            {"role": "user", "content": _USER_PREFIX + text}
+        ],
+        "temperature": 0.2,
+        "max_tokens": 200,
+        "response_format": {"type": "json_object"}
+    }
+
+
+async def _request_incident(params: dict) -> dict:
+    """Run one Groq chat completion and validate the parsed incident"""
+    try:
+        completion = await groq_client.chat.completions.create(**params)
+
+        response_text = completion.choices[0].message.content
+
+        if not response_text:
+            raise ValueError("Empty response from Groq API")
+
+        parsed_data = parse_groq_response(response_text)
+        _PARSED_VALIDATOR.validate_python(parsed_data)
+
+        return {"success": True, "data": parsed_data, "error": None}
+
+    except Exception as api_error:
+        error_msg = f"Groq API error: {str(api_error)}"
+        return {"success": False, "data": None, "error": error_msg}
+
+
+async def _request_and_cache(cache_key: bytes, text: str) -> dict:
+    result = await _request_incident(_completion_params(text))
+    if result["success"]:
+        _RESULT_CACHE[cache_key] = result["data"]
+
+    return result
+
+
+async def _parse_one(text: str) -> dict:
+    """Parse a single incident report, serving repeats from the result cache"""
+    cache_key = hashlib.sha256(text.strip().lower().encode()).digest()
+    cached = _RESULT_CACHE.get(cache_key)
+    if cached is not None:
+        return {"success": True, "data": cached, "error": None}
+
+    fast_data = _try_fast_parse(text)
+    if fast_data is not None:
+        _PARSED_VALIDATOR.validate_python(fast_data)
+        return {"success": True, "data": fast_data, "error": None}
+
+    # Single-flight: concurrent requests for the same report share one Groq
+    # call. The shield keeps one caller's cancellation from failing the rest.
+    task = _IN_FLIGHT.get(cache_key)
+    if task is None:
+        task = asyncio.ensure_future(_request_and_cache(cache_key, text))
+        _IN_FLIGHT[cache_key] = task
+        task.add_done_callback(lambda _: _IN_FLIGHT.pop(cache_key, None))
+
+    return await asyncio.shield(task)
+
 
+async def _gather_bounded(func, items: list) -> List[dict]:
+    """Apply an async parse function to every item, capping Groq concurrency"""
+    async def run(item) -> dict:
+        async with _BATCH_SEMAPHORE:
+            return await func(item)
 
+    results = await asyncio.gather(*[run(item) for item in items],
+                                   return_exceptions=True)
+
+    return [
+        result if not isinstance(result, BaseException) else {
+            "success": False,
+            "data": None,
+            "error": f"Error processing request: {str(result)}"
+        }
+        for result in results
+    ]
+
+
+# The parse endpoints return pre-built ORJSONResponse objects: every incident
+# has already been validated against ParsedIncident, so FastAPI's second
+# validation pass through response_model is skipped. The response_model is
+# kept only to document the response shape in the OpenAPI schema.
 @app.post("/api/parse-incident", response_model=ParseResponse)
 async def parse_incident(incident: IncidentInput):
     """
@@ -239,57 +549,269 @@ async def parse_incident(incident: IncidentInput):
     - Impact_Count: Number of affected users
     """
     try:
-        if not incident.text or len(incident.text.strip()) < 10:
+        return ORJSONResponse(await _parse_one(incident.text))
+
+    except Exception as e:
+        return ORJSONResponse({
+            "success": False,
+            "data": None,
+            "error": f"Error processing request: {str(e)}"
+        })
+
+
+@app.post("/api/parse-incidents", response_model=BatchParseResponse)
+async def parse_incidents(batch: IncidentBatch):
+    """
+    Parse several unstructured incident reports in one request
+
+    - **texts**: List of unstructured incident report texts
+
+    Reports are sent to Groq concurrently, with at most 16 batch calls in
+    flight per worker process across all requests.
+    Results are returned in input order, each shaped like the
+    /api/parse-incident response.
+    """
+    results = await _gather_bounded(_parse_one, batch.texts)
+    return ORJSONResponse({"results": results})
+
+
+async def _download_jsonl(file_id: str) -> List[dict]:
+    """Fetch a Groq file and decode it as JSON Lines"""
+    content = await groq_client.files.content(file_id)
+    data = await content.read()
+    return [orjson.loads(line) for line in data.splitlines() if line.strip()]
+
+
+async def _get_own_batch(job_id: str):
+    """Retrieve a batch job, refusing jobs not created by this service"""
+    try:
+        job = await groq_client.batches.retrieve(job_id)
+    except NotFoundError:
+        job = None
+
+    if job is None or not isinstance(job.metadata, dict) \
+            or job.metadata.get("source") != _BATCH_SOURCE:
+        raise HTTPException(status_code=404, detail="Batch job not found")
+
+    return job
+
+
+async def _wait_for_batch(job, wait: float):
+    """Poll a batch job until it reaches a terminal state or wait runs out"""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + wait
+    while job.status not in _BATCH_TERMINAL_STATUSES and loop.time() < deadline:
+        await asyncio.sleep(min(_BATCH_POLL_INTERVAL, deadline - loop.time()))
+        job = await groq_client.batches.retrieve(job.id)
+    return job
+
+
+async def _batch_size(job) -> int:
+    """Number of reports in a batch job, reading its input file only if needed"""
+    if job.request_counts is not None and job.request_counts.total:
+        return job.request_counts.total
+    return len(await _download_jsonl(job.input_file_id))
+
+
+def _batch_row_index(custom_id: str) -> int:
+    return int(custom_id.rsplit("-", 1)[-1])
+
+
+def _batch_row_text(row: dict) -> str:
+    """Recover the incident text from one line of a batch input file"""
+    user_prompt = row["body"]["messages"][-1]["content"]
+    if not user_prompt.startswith(_USER_PREFIX):
+        raise ValueError("unexpected prompt in batch input")
+    return user_prompt[len(_USER_PREFIX):]
+
+
+def _parse_batch_row(row: dict) -> dict:
+    """Convert one line of a Groq batch output or error file into a parse result"""
+    try:
+        error = row.get("error")
+        if error:
+            raise ValueError(error.get("message", error) if isinstance(error, dict) else error)
+
+        response = row["response"]
+        if response.get("status_code") != 200:
+            raise ValueError(f"status code {response.get('status_code')}")
+
+        response_text = response["body"]["choices"][0]["message"]["content"]
+        if not response_text:
+            raise ValueError("Empty response from Groq API")
+
+        parsed_data = parse_groq_response(response_text)
+        _PARSED_VALIDATOR.validate_python(parsed_data)
+
+        return {"success": True, "data": parsed_data, "error": None}
+
+    except Exception as e:
+        return {"success": False, "data": None, "error": f"Groq API error: {str(e)}"}
+
+
+async def _read_batch_results(job) -> dict:
+    """Map report index to parse result for every row Groq has written"""
+    results = {}
+    for file_id in (job.output_file_id, job.error_file_id):
+        if file_id:
+            for row in await _download_jsonl(file_id):
+                results[_batch_row_index(row["custom_id"])] = _parse_batch_row(row)
+    return results
+
+
+def _batch_job_response(job, results: Optional[dict], total: int = 0) -> ORJSONResponse:
+    if results is None:
+        return ORJSONResponse({"job_id": job.id, "status": job.status, "results": None})
+
+    missing = {
+        "success": False,
+        "data": None,
+        "error": "Groq API error: no result returned for this report"
+    }
+    return ORJSONResponse({
+        "job_id": job.id,
+        "status": job.status,
+        "results": [results.get(index, missing) for index in range(total)]
+    })
+
+
+@app.post("/api/parse-incidents/batch", response_model=BatchJobResponse)
+async def submit_incident_batch(batch: IncidentBatchJob):
+    """
+    Submit incident reports to Groq's asynchronous batch API
+
+    - **texts**: List of unstructured incident report texts
+
+    Intended for bulk ingest where latency does not matter; batch jobs are
+    billed at a discount and have higher rate limits. Returns a job id to
+    poll with GET /api/batch/{job_id}.
+    """
+    lines = []
+    size = 0
+    for index, text in enumerate(batch.texts):
+        line = orjson.dumps({
+            "custom_id": f"incident-{index}",
+            "method": "POST",
+            "url": "/v1/chat/completions",
+            "body": _completion_params(text)
+        })
+        size += len(line) + 1
+        if size > _BATCH_FILE_MAX_BYTES:
+            raise HTTPException(
+                status_code=413,
+                detail="Batch is larger than Groq's batch file size limit"
+            )
+        lines.append(line)
+
+    try:
+        input_file = await groq_client.files.create(
+            file=("incidents.jsonl", b"\n".join(lines)),
+            purpose="batch"
+        )
+        job = await groq_client.batches.create(
+            completion_window="24h",
+            endpoint="/v1/chat/completions",
+            input_file_id=input_file.id,
+            metadata={"source": _BATCH_SOURCE}
+        )
+
+        return _batch_job_response(job, None)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=502,
+            detail=f"Groq API error: {str(e)}"
+        )
+
+
+@app.get("/api/batch/{job_id}", response_model=BatchJobResponse)
+async def get_incident_batch(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=300,
+                        description="Seconds to wait for the job to finish"),
+):
+    """
+    Retrieve the results of a batch job submitted to /api/parse-incidents/batch
+
+    Results are returned in submission order once the job has completed;
+    reports that failed inside the job carry their error.
+    """
+    try:
+        job = await _wait_for_batch(await _get_own_batch(job_id), wait)
+
+        if job.status != "completed":
+            return _batch_job_response(job, None)
+
+        return _batch_job_response(
+            job, await _read_batch_results(job), await _batch_size(job))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=502,
+            detail=f"Groq API error: {str(e)}"
+        )
+
+
+@app.post("/api/batch/{job_id}/fallback", response_model=BatchJobResponse)
+async def fallback_incident_batch(
+    job_id: str,
+    wait: float = Query(0, ge=0, le=300,
+                        description="Seconds to let the job finish before falling back"),
+):
+    """
+    Finish a batch job through the interactive Groq path
+
+    Waits up to **wait** seconds for the job, then cancels it if it is still
+    running. Reports without a successful batch result are parsed
+    interactively (and cached), and all results are returned in submission
+    order. Limited to jobs of at most 100 reports.
+    """
+    try:
+        job = await _get_own_batch(job_id)
+
+        if await _batch_size(job) > _BATCH_FALLBACK_MAX:
             raise HTTPException(
                 status_code=400,
-                detail="Incident text must be at least 10 characters long"
+                detail=f"fallback is only available for jobs of at most {_BATCH_FALLBACK_MAX} reports"
             )
 
-        system_prompt, user_prompt = create_parsing_prompt(incident.text)
-
-        try:
-            completion = groq_client.chat.completions.create(
-                model="llama-3.1-8b-instant",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt}
-                ],
-                temperature=0.2,
-                max_tokens=500,
-                response_format={"type": "json_object"}
-            )
+        job = await _wait_for_batch(job, wait)
+        if job.status not in _BATCH_TERMINAL_STATUSES \
+                and job.status not in _BATCH_WINDING_DOWN_STATUSES:
+            job = await groq_client.batches.cancel(job_id)
 
-            response_text = completion.choices[0].message.content
+        results = await _read_batch_results(job)
 
-            if not response_text:
-                raise ValueError("Empty response from Groq API")
+        inputs = await _download_jsonl(job.input_file_id)
+        pending = [row for row in inputs
+                   if not results.get(_batch_row_index(row["custom_id"]), {}).get("success")]
 
-            parsed_data = parse_groq_response(response_text)
-            parsed_incident = ParsedIncident(**parsed_data)
+        async def parse_row(row: dict) -> dict:
+            return await _parse_one(_batch_row_text(row))
 
-            return ParseResponse(
-                success=True,
-                data=parsed_incident,
-                error=None
-            )
+        for row, result in zip(pending, await _gather_bounded(parse_row, pending)):
+            results[_batch_row_index(row["custom_id"])] = result
 
-        except Exception as api_error:
-            error_msg = f"Groq API error: {str(api_error)}"
-            return ParseResponse(
-                success=False,
-                data=None,
-                error=error_msg
-            )
+        return _batch_job_response(job, results, len(inputs))
 
     except HTTPException:
         raise
     except Exception as e:
-        return ParseResponse(
-            success=False,
-            data=None,
-            error=f"Error processing request: {str(e)}"
+        raise HTTPException(
+            status_code=502,
+            detail=f"Groq API error: {str(e)}"
         )
 
 if __name__ == "__main__":
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", "4")),
+        loop="uvloop",
+        http="httptools",
+        access_log=False
+    )
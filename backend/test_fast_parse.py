@@ -0,0 +1,61 @@
+import os
+
+import pytest
+
+os.environ.setdefault("GROQ_API_KEY", "test-key")
+
+from main import _try_fast_parse  # noqa: E402
+
+
+@pytest.mark.parametrize("text, expected", [
+    (
+        "Hey team, the production database US-East-1 just timed out at 6:30 PM. "
+        "I think it's the migration script. 500 users affected. Full outage.",
+        {
+            "Severity": "High",
+            "Component": "Database US-East-1",
+            "Timestamp": "18:30:00",
+            "Suspected_Cause": "Migration script",
+            "Impact_Count": 500,
+        },
+    ),
+    (
+        "Cache eu-west-2 is slow since 09:15 after a config change, 40 users affected",
+        {
+            "Severity": "Med",
+            "Component": "Cache eu-west-2",
+            "Timestamp": "09:15:00",
+            "Suspected_Cause": "Configuration change",
+            "Impact_Count": 40,
+        },
+    ),
+    # Migration takes priority over deploy when both are mentioned.
+    (
+        "Database db-01 crashed at 02:00 during the migration after the deploy, 12 users affected",
+        {
+            "Severity": "High",
+            "Component": "Database db-01",
+            "Timestamp": "02:00:00",
+            "Suspected_Cause": "Migration script",
+            "Impact_Count": 12,
+        },
+    ),
+])
+def test_fast_parse_extracts_all_fields(text, expected):
+    assert _try_fast_parse(text) == expected
+
+
+@pytest.mark.parametrize("text", [
+    # Component without an identifier: the qualifier ("Login") would be lost.
+    "Login API down at 09:15 after the 2.3 deploy, 1200 users affected",
+    # Severity keywords disagree.
+    "Minor typo on the cache eu-west-1 page, not down, 3 users affected at 10:00 after deploy",
+    # Count written with a thousands separator.
+    "Cache eu-west-1 outage at 1:30 pm, 1,500 users affected, network issue",
+    # No recognizable cause.
+    "Database db-01 outage at 1:30 pm, 15 users affected",
+    # No time mentioned.
+    "Database db-01 outage after deploy, 15 users affected",
+])
+def test_fast_parse_defers_uncertain_reports(text):
+    assert _try_fast_parse(text) is None